@@ -1,25 +1,51 @@
 #!/usr/bin/env python
 
+import importlib
+
 import click
 
 from sw_cli import __version__
-from sw_cli.cmds.config_cmd import config_cmd
-from sw_cli.cmds.favorite_cmd import favorite_cmd
-from sw_cli.cmds.history_cmd import history_cmd
-from sw_cli.cmds.next_cmd import next_cmd
-from sw_cli.cmds.prev_cmd import prev_cmd
-from sw_cli.cmds.queue_cmd import queue_cmd
-from sw_cli.cmds.set_cmd import set_cmd
-from sw_cli.cmds.status_cmd import status_cmd
-from sw_cli.cmds.timer_cmd import timer_cmd
-
-
-@click.group()
+from sw_cli.utils.style import set_color_mode
+
+COMMANDS = {
+    "config": "sw_cli.cmds.config_cmd:config_cmd",
+    "favorite": "sw_cli.cmds.favorite_cmd:favorite_cmd",
+    "history": "sw_cli.cmds.history_cmd:history_cmd",
+    "next": "sw_cli.cmds.next_cmd:next_cmd",
+    "prev": "sw_cli.cmds.prev_cmd:prev_cmd",
+    "queue": "sw_cli.cmds.queue_cmd:queue_cmd",
+    "set": "sw_cli.cmds.set_cmd:set_cmd",
+    "status": "sw_cli.cmds.status_cmd:status_cmd",
+    "timer": "sw_cli.cmds.timer_cmd:timer_cmd",
+}
+
+COLOR_CHOICES = click.Choice(["auto", "never", "always"], case_sensitive=False)
+
+
+class LazyGroup(click.Group):
+    """Click group that only imports a subcommand's module when it is requested."""
+
+    def __init__(self, *args, lazy_commands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
+
+    def list_commands(self, ctx):
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name not in self.lazy_commands:
+            return super().get_command(ctx, cmd_name)
+
+        module_path, attr = self.lazy_commands[cmd_name].split(":")
+        return getattr(importlib.import_module(module_path), attr)
+
+
+@click.group(cls=LazyGroup, lazy_commands=COMMANDS)
 @click.option("--silent", "-s", is_flag=True, help="Suppress output when necessary.")
 @click.option(
     "--color",
     "-c",
-    type=click.Choice(["auto", "never", "always"], case_sensitive=False),
+    type=COLOR_CHOICES,
     default="auto",
     help="Control colored output: auto, never, or always.",
 )
@@ -31,16 +57,5 @@ def cli(ctx, silent=False, color="auto", notify=False):
     """sw - An overly complicated wallpaper switcher for Hyprland."""
     ctx.ensure_object(dict)
     ctx.obj["color"] = color
-    ctx.obj["notify"] = notify
-    ctx.obj["silent"] = silent
-
-
-cli.add_command(config_cmd)
-cli.add_command(favorite_cmd)
-cli.add_command(history_cmd)
-cli.add_command(next_cmd)
-cli.add_command(prev_cmd)
-cli.add_command(queue_cmd)
-cli.add_command(set_cmd)
-cli.add_command(status_cmd)
-cli.add_command(timer_cmd)
+    ctx.obj["flags"] = (silent, notify)
+    set_color_mode(color)
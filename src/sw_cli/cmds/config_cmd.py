@@ -2,14 +2,47 @@
 
 import click
 
-from sw_cli.utils import cyan, err, format_json, green, log, red, yellow
-from sw_lib.config import Config, ConfigError, ConfigKeyError, ConfigLoadError, ConfigValidationError, ConfigWriteError
-
-
-def is_list_property(config: Config, key: str) -> bool:
+from sw_cli.utils import cli_errors, cyan, format_json, green, log, red, yellow
+from sw_lib.config import (
+    Config,
+    ConfigError,
+    ConfigLoadError,
+    ConfigValidationError,
+    ConfigWriteError,
+    get_config,
+)
+
+
+def collect_list_keys(data: dict, prefix: str = "") -> set[str]:
+    """Collect the dotted key paths whose default value is a list."""
+    keys = set()
+    for key, value in data.items():
+        dotted_key = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            keys |= collect_list_keys(value, dotted_key)
+        elif isinstance(value, list):
+            keys.add(dotted_key)
+    return keys
+
+
+LIST_KEYS = frozenset(collect_list_keys(Config.DEFAULT_CONFIG))
+
+CONFIG_ERRORS = (
+    ((ConfigLoadError, ConfigValidationError), "Failed to load configuration"),
+    (ConfigWriteError, "Failed to write to configuration."),
+    (ConfigError, "Configuration error."),
+)
+
+ACTION_MESSAGES = {
+    "append": ("Appended to '{key}': {values}", green),
+    "remove": ("Removed from '{key}': {values}", red),
+    "set": ("Set '{key}' to: {values}", green),
+}
+
+
+def is_list_property(key: str) -> bool:
     """Check if a config key path points to a list-type value."""
-    value = config.get(key, None)
-    return isinstance(value, list)
+    return key in LIST_KEYS
 
 
 def parse_val(val: str) -> int | float | bool | str:
@@ -19,6 +52,8 @@ def parse_val(val: str) -> int | float | bool | str:
         return True
     if val == "false":
         return False
+    if not any(ch.isdigit() for ch in val):
+        return val
     try:
         return int(val)
     except ValueError:
@@ -35,12 +70,18 @@ def update_list_key(config: Config, key: str, values: tuple[str], append: bool,
         raise click.BadParameter(f"Key '{key}' is not a list")
 
     if append:
-        new = list(dict.fromkeys(current + list(values)))
+        seen = set(current)
+        new = list(current)
+        for value in values:
+            if value not in seen:
+                seen.add(value)
+                new.append(value)
         config.set(key, new)
         return "append", key, values
 
     if remove:
-        new = [v for v in current if v not in values]
+        to_remove = set(values)
+        new = [v for v in current if v not in to_remove]
         config.set(key, new)
         return "remove", key, values
 
@@ -63,23 +104,19 @@ def config_cmd():
 @click.help_option("--help", "-h")
 @click.argument("key", required=True)
 @click.pass_context
-def get_config(ctx, key):
+@cli_errors((ConfigError, "Error getting key '{key}'"), message="Unexpected error while getting key '{key}'")
+def get_config_cmd(ctx, key):
     """Get the current value of a configuration key."""
-    try:
-        config = Config()
-        value = config.get(key)
-        if value is None:
-            log(f"{cyan(key)}: {yellow('not set')}", ctx)
+    config = get_config()
+    value = config.get(key)
+    if value is None:
+        log(f"{cyan(key)}: {yellow('not set')}", ctx)
+    else:
+        if isinstance(value, list):
+            colored_list = ", ".join(green(str(v)) for v in value)
+            log(f"{cyan(key)}: [{colored_list}]", ctx)
         else:
-            if isinstance(value, list):
-                colored_list = ", ".join(green(str(v)) for v in value)
-                log(f"{cyan(key)}: [{colored_list}]", ctx)
-            else:
-                log(f"{cyan(key)}: {green(value)}", ctx)
-    except (ConfigLoadError, ConfigValidationError, ConfigError, ConfigKeyError) as e:
-        err(f"Error getting key '{key}'", e, ctx)
-    except Exception as e:
-        err(f"Unexpected error while getting key '{key}'", e, ctx)
+            log(f"{cyan(key)}: {green(value)}", ctx)
 
 
 @config_cmd.command("set")
@@ -89,75 +126,51 @@ def get_config(ctx, key):
 @click.option("--append", is_flag=True, help="Append value(s) to list-type key.")
 @click.option("--remove", is_flag=True, help="Remove value(s) from list-type key.")
 @click.pass_context
+@cli_errors(*CONFIG_ERRORS, (click.BadParameter, "Invalid value"))
 def set_config_cmd(ctx, key, values, append, remove):
     """Set a configuration key to a new value."""
     key = key.strip()
+    config = get_config()
 
-    try:
-        config = Config()
+    if is_list_property(key):
+        action, key, vals = update_list_key(config, key, values, append, remove)
+        config.flush()
 
-        if is_list_property(config, key):
-            action, key, vals = update_list_key(config, key, values, append, remove)
+        template, color = ACTION_MESSAGES[action]
+        log(template.format(key=cyan(key), values=", ".join(color(v) for v in vals)), ctx)
+    else:
+        if append or remove:
+            raise click.BadParameter(f"Key '{key}' does not support --append/--remove")
 
-            if action == "append":
-                msg = f"Appended to '{cyan(key)}': {', '.join(green(v) for v in vals)}"
-            elif action == "remove":
-                msg = f"Removed from '{cyan(key)}': {', '.join(red(v) for v in vals)}"
-            else:
-                msg = f"Set '{cyan(key)}' to: {', '.join(green(v) for v in vals)}"
+        if len(values) > 1:
+            raise click.BadParameter(f"Key '{key}' only accepts a single value, but multiple were given.")
 
-            log(msg, ctx)
-        else:
-            if append or remove:
-                raise click.BadParameter(f"Key '{key}' does not support --append/--remove")
-
-            if len(values) > 1:
-                raise click.BadParameter(f"Key '{key}' only accepts a single value, but multiple were given.")
-
-            val = parse_val(values[0])
-            config.set(key, val)
-            log(f"Set '{cyan(key)}' to: {green(val)}", ctx)
-    except (ConfigLoadError, ConfigValidationError) as e:
-        err("Failed to load configuration", e, ctx)
-    except ConfigWriteError as e:
-        err("Failed to write to configuration.", e, ctx)
-    except ConfigError as e:
-        err("Configuration error.", e, ctx)
-    except Exception as e:
-        err("Unexpected error", e, ctx)
+        val = parse_val(values[0])
+        config.set(key, val)
+        config.flush()
+        log(f"Set '{cyan(key)}' to: {green(val)}", ctx)
 
 
 @config_cmd.command("unset")
 @click.help_option("--help", "-h")
 @click.argument("key", required=True)
 @click.pass_context
+@cli_errors(*CONFIG_ERRORS)
 def unset_config_cmd(ctx, key):
     """Unset a configuration key."""
-    try:
-        config = Config()
+    config = get_config()
 
-        config.unset(key)
-        log(f"{cyan(key)}: {yellow('unset')}", ctx)
-    except (ConfigLoadError, ConfigValidationError) as e:
-        err("Failed to load configuration", e, ctx)
-    except ConfigWriteError as e:
-        err("Failed to write to configuration.", e, ctx)
-    except ConfigError as e:
-        err("Configuration error.", e, ctx)
-    except Exception as e:
-        err("Unexpected error", e, ctx)
+    config.unset(key)
+    config.flush()
+    log(f"{cyan(key)}: {yellow('unset')}", ctx)
 
 
 @config_cmd.command("show")
 @click.help_option("--help", "-h")
 @click.pass_context
+@cli_errors((ConfigError, "Failed to load configuration"), message="Unexpected error while showing configuration")
 def show_config(ctx):
     """Show all configuration settings."""
-    try:
-        config = Config()
-        config_data = config.get_all()
-        log(format_json(config_data), ctx)
-    except (ConfigLoadError, ConfigValidationError, ConfigError) as e:
-        err("Failed to load configuration", e, ctx)
-    except Exception as e:
-        err("Unexpected error while showing configuration", e, ctx)
+    config = get_config()
+    config_data = config.get_all()
+    log(format_json(config_data), ctx)
@@ -1,13 +1,41 @@
 #!/usr/bin/env python
 
+from functools import lru_cache
 from pathlib import Path
 
 import click
 
-from sw_cli.utils import cyan, err, green, log, red, resolve_indexed_path, warn, yellow
-from sw_lib.config import Config, ConfigError, ConfigLoadError, ConfigValidationError, ConfigWriteError
+from sw_cli.utils import cli_errors, cyan, green, log, red, resolve_indexed_path, warn, yellow
+from sw_lib.config import ConfigError, ConfigLoadError, ConfigValidationError, ConfigWriteError, get_config
 from sw_lib.history import HistoryEntryNotFoundError, HistoryError, HistoryManager
 
+FAVORITE_ERRORS = (
+    ((ConfigLoadError, ConfigValidationError), "Failed to load configuration"),
+    (ConfigWriteError, "Failed to write to configuration."),
+    (ConfigError, "Configuration error."),
+    ((HistoryEntryNotFoundError, HistoryError), "Failed to get current wallpaper from history"),
+)
+
+
+def canonical_path(path: str, config) -> str:
+    """
+    Expand and resolve a path into the form stored in the favorites list.
+
+    A path that is already stored as given is returned without walking the
+    filesystem; anything else goes through resolve() so symlinks and '..'
+    parts map to the same favorite.
+    """
+    expanded = str(Path(path).expanduser())
+    if config.is_favorite(expanded):
+        return expanded
+    return str(Path(expanded).resolve())
+
+
+@lru_cache(maxsize=1)
+def get_current_wallpaper(history_file: Path) -> str:
+    """Return the path of the most recently applied wallpaper."""
+    return HistoryManager(history_file).get(-1).path
+
 
 @click.group("favorite", short_help="Manage favorite wallpapers")
 @click.help_option("--help", "-h")
@@ -24,6 +52,7 @@ def favorite_cmd():
 @click.help_option("--help", "-h")
 @click.argument("path", required=False)
 @click.pass_context
+@cli_errors(*FAVORITE_ERRORS)
 def favorite_add_cmd(ctx, path):
     """
     Add a wallpaper to your favorites.
@@ -33,45 +62,27 @@ def favorite_add_cmd(ctx, path):
     - A direct path to an image
     - A history index with '@N'
     """
-    try:
-        config = Config()
-        favorites = list(map(str, config.favorites))
-        hm = HistoryManager(config.history_file)
-
-        if not favorites:
-            warn("No favorites to remove.", ctx)
-            return
-
-        if path:
-            if path.startswith("@"):
-                path = resolve_indexed_path(path, hm.get()).path
-        else:
-            path = hm.get(-1).path
-
-        path = str(Path(path).expanduser().resolve())
-
-        if path in favorites:
-            warn("Already in favorites.", ctx)
-        else:
-            favorites.append(path)
-            config.set("wallpaper.favorites", favorites)
-            log(f"Added to {cyan('favorites')}: {green(path)}", ctx)
-    except (ConfigLoadError, ConfigValidationError) as e:
-        err("Failed to load configuration", e, ctx)
-    except ConfigWriteError as e:
-        err("Failed to write to configuration.", e, ctx)
-    except ConfigError as e:
-        err("Configuration error.", e, ctx)
-    except (HistoryEntryNotFoundError, HistoryError) as e:
-        err("Failed to get current wallpaper from history", e, ctx)
-    except Exception as e:
-        err(red("Unexpected error"), e, ctx)
+    config = get_config()
+
+    if not path:
+        path = get_current_wallpaper(config.history_file)
+    elif path.startswith("@"):
+        path = resolve_indexed_path(path, HistoryManager(config.history_file).get()).path
+
+    path = canonical_path(path, config)
+
+    if config.add_favorite(path):
+        config.flush()
+        log(f"Added to {cyan('favorites')}: {green(path)}", ctx)
+    else:
+        warn("Already in favorites.", ctx)
 
 
 @favorite_cmd.command("rm")
 @click.help_option("--help", "-h")
 @click.argument("path", required=False)
 @click.pass_context
+@cli_errors(*FAVORITE_ERRORS, (ValueError, "Invalid index provided"))
 def favorite_rm_cmd(ctx, path):
     """
     Remove a wallpaper from your favorites.
@@ -81,62 +92,41 @@ def favorite_rm_cmd(ctx, path):
     - A direct path to an image
     - A favorite index with '@N'
     """
-    try:
-        config = Config()
-        favorites = list(map(str, config.favorites))
-        hm = HistoryManager(config.history_file)
-
-        if not favorites:
-            warn("No favorites to remove.", ctx)
-            return
-
-        if path:
-            if path.startswith("@"):
-                path = resolve_indexed_path(path, favorites)
-        else:
-            path = hm.get(-1).path
-
-        path = str(Path(path).expanduser().resolve())
-
-        if path in favorites:
-            favorites.remove(path)
-            config.set("wallpaper.favorites", favorites)
-            log(f"Removed from {cyan('favorites')}: {red(path)}", ctx)
-        else:
-            warn("Not in favorites.", ctx)
-    except IndexError as e:
-        err(f"Invalid index provided: {e}", ctx)
-    except (ConfigLoadError, ConfigValidationError) as e:
-        err("Failed to load configuration", e, ctx)
-    except ConfigWriteError as e:
-        err("Failed to write to configuration.", e, ctx)
-    except ConfigError as e:
-        err("Configuration error.", e, ctx)
-    except (HistoryEntryNotFoundError, HistoryError) as e:
-        err("Failed to get current wallpaper from history", e, ctx)
-    except Exception as e:
-        err(red("Unexpected error"), e, ctx)
+    config = get_config()
+    favorites = list(map(str, config.favorites))
+
+    if not favorites:
+        warn("No favorites to remove.", ctx)
+        return
+
+    if not path:
+        path = canonical_path(get_current_wallpaper(config.history_file), config)
+    elif path.startswith("@"):
+        path = resolve_indexed_path(path, favorites)
+    else:
+        path = canonical_path(path, config)
+
+    if config.remove_favorite(path):
+        config.flush()
+        log(f"Removed from {cyan('favorites')}: {red(path)}", ctx)
+    else:
+        warn("Not in favorites.", ctx)
 
 
 @favorite_cmd.command("list")
 @click.help_option("--help", "-h")
 @click.pass_context
+@cli_errors((ConfigError, "Failed to load configuration"), message="Unexpected error while listing favorites.")
 def favorite_list_cmd(ctx):
     """
     List all favorite wallpapers.
     """
-    try:
-        config = Config()
-        favorites = list(map(str, config.favorites))
-
-        if not favorites:
-            warn("No favorites found.", ctx)
-            return
+    config = get_config()
+    favorites = list(map(str, config.favorites))
 
-        for idx, path in enumerate(favorites, start=1):
-            log(f"{yellow(str(idx))}: {green(path)}", ctx)
+    if not favorites:
+        warn("No favorites found.", ctx)
+        return
 
-    except (ConfigLoadError, ConfigValidationError, ConfigError) as e:
-        err("Failed to load configuration", e, ctx)
-    except Exception as e:
-        err(red("Unexpected error while listing favorites."), e, ctx)
+    lines = [f"{yellow(str(idx))}: {green(path)}" for idx, path in enumerate(favorites, start=1)]
+    log("\n".join(lines), ctx)
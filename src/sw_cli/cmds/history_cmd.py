@@ -1,12 +1,13 @@
 #!/usr/bin/env python
 
-import time
+import bisect
+from datetime import datetime
 
 import click
 
 from sw_cli.utils.common import err, log, warn
 from sw_cli.utils.style import bold, green, red, yellow
-from sw_lib.config import Config, ConfigError, ConfigLoadError, ConfigValidationError
+from sw_lib.config import ConfigError, ConfigLoadError, ConfigValidationError, get_config
 from sw_lib.history import (
     HistoryEntryNotFoundError,
     HistoryError,
@@ -19,12 +20,16 @@ from sw_lib.history import (
 
 
 def print_history_entries(ctx, entries):
+    lines = []
     for i, entry in entries:
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(entry.time))
+        timestamp = datetime.fromtimestamp(entry.time).isoformat(sep=" ", timespec="seconds")
         idx_str = yellow(f"{i + 1:>3}")
         path_str = green(entry.path)
         time_str = yellow(f"({timestamp})")
-        log(f"{idx_str}: {path_str} {time_str}", ctx)
+        lines.append(f"{idx_str}: {path_str} {time_str}")
+
+    if lines:
+        log("\n".join(lines), ctx)
 
 
 @click.group("history", short_help="Manage wallpaper history")
@@ -45,23 +50,21 @@ def history_cmd():
 def history_list_cmd(ctx, lines, unique):
     """List entries in the wallpaper history."""
     try:
-        config = Config()
+        config = get_config()
         hm = HistoryManager(config.history_file, config.history_limit, config.recency_timeout)
         all_entries = hm.get()
 
-        if lines:
-            entries = list(enumerate(all_entries))[-lines:]
-        else:
-            entries = list(enumerate(all_entries))
+        start = max(0, len(all_entries) - lines) if lines else 0
 
-        if unique:
-            seen = set()
-            deduped = []
-            for i, entry in entries:
-                if entry.path not in seen:
-                    seen.add(entry.path)
-                    deduped.append((i, entry))
-            entries = deduped
+        seen = set()
+        entries = []
+        for i in range(start, len(all_entries)):
+            entry = all_entries[i]
+            if unique:
+                if entry.path in seen:
+                    continue
+                seen.add(entry.path)
+            entries.append((i, entry))
 
         print_history_entries(ctx, entries)
 
@@ -95,19 +98,31 @@ def remove_all_entries(ctx, hm, yes):
     log(green("All history cleared."), ctx)
 
 
-def remove_filtered_entries(ctx, hm, entries, options):
-    original_count = len(entries)
-    remaining = entries[:]
+def filter_entries(entries, since=None, duplicates=False):
+    """
+    Return the entries surviving the --since and --duplicates filters.
+
+    Entries are appended in time order, so the --since cutoff is found with
+    a binary search. The rest is walked newest to oldest so duplicates keep
+    their latest occurrence. The last entry is always kept as it is the
+    current wallpaper.
+    """
+    start = bisect.bisect_left(entries, int(since.timestamp()), key=lambda e: e.time) if since else 0
+    seen = {entries[-1].path}
+    remaining = [entries[-1]]
+    for e in reversed(entries[start:-1]):
+        if duplicates:
+            if e.path in seen:
+                continue
+            seen.add(e.path)
+        remaining.append(e)
+    remaining.reverse()
+    return remaining
 
-    if options.get("since"):
-        cutoff = int(options.get("since").timestamp())
-        remaining = [e for e in remaining if e.time >= cutoff]
 
-    if options.get("duplicates"):
-        seen = {}
-        for e in reversed(remaining):
-            seen[e.path] = e
-        remaining = list(reversed(list(seen.values())))
+def remove_filtered_entries(ctx, hm, entries, options):
+    original_count = len(entries)
+    remaining = filter_entries(entries, options.get("since"), options.get("duplicates"))
 
     if len(remaining) == original_count:
         warn("No entries removed.", ctx)
@@ -118,14 +133,9 @@ def remove_filtered_entries(ctx, hm, entries, options):
         log(f"{green(original_count)} entries found. {red(removed_count)} will be removed.", ctx)
         click.confirm(bold(yellow("Proceed with removal?")), abort=True)
 
-    removed_entries = []
-    # Never remove last entry
-    for i in reversed(range(len(entries))):
-        if i == len(entries) - 1:
-            continue
-        if entries[i] not in remaining:
-            removed_entries.append(entries[i].path)
-            hm.remove_by_index(i)
+    kept = set(remaining)
+    removed_entries = [e.path for e in reversed(entries) if e not in kept]
+    hm.replace(remaining)
 
     for path in removed_entries:
         log(f"Removed entry: {red(path)}", ctx)
@@ -151,7 +161,7 @@ def remove_filtered_entries(ctx, hm, entries, options):
 def history_rm_cmd(ctx, index, all_entries, duplicates, since, yes):
     """Remove specific, duplicate, or old entries from wallpaper history."""
     try:
-        config = Config()
+        config = get_config()
         hm = HistoryManager(config.history_file, config.history_limit, config.recency_timeout)
         entries = hm.get()
 
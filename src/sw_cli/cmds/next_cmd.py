@@ -6,7 +6,7 @@ from sw_cli.ipc import SWDaemonError
 from sw_cli.queue import QueueManager
 from sw_cli.utils import err, green, log
 from sw_cli.wallpaper import WallpaperApplier, WallpaperApplyError, WallpaperNotFoundError, WallpaperSelector
-from sw_lib.config import Config, ConfigError, ConfigLoadError, ConfigValidationError
+from sw_lib.config import ConfigError, ConfigLoadError, ConfigValidationError, get_config
 from sw_lib.history import HistoryEntryError, HistoryManager
 
 
@@ -23,7 +23,7 @@ def next_cmd(ctx):
     - Random from the default directory
     """
     try:
-        config = Config()
+        config = get_config()
         qm = QueueManager(config.queue_file)
         hm = HistoryManager(
             config.history_file,
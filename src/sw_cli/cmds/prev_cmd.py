@@ -5,7 +5,7 @@ import click
 from sw_cli.ipc import SWDaemonError
 from sw_cli.utils import err, green, log
 from sw_cli.wallpaper import WallpaperApplier, WallpaperApplyError, WallpaperNotFoundError
-from sw_lib.config import Config, ConfigError, ConfigLoadError, ConfigValidationError
+from sw_lib.config import ConfigError, ConfigLoadError, ConfigValidationError, get_config
 from sw_lib.history import HistoryEntryNotFoundError, HistoryManager
 
 
@@ -15,7 +15,7 @@ from sw_lib.history import HistoryEntryNotFoundError, HistoryManager
 def prev_cmd(ctx):
     """Set the previous wallpaper"""
     try:
-        config = Config()
+        config = get_config()
         hm = HistoryManager(
             config.history_file,
             config.history_limit,
@@ -6,7 +6,7 @@ import click
 
 from sw_cli.queue import QueueError, QueueManager, QueueNotFoundError, QueueReadError, QueueWriteError
 from sw_cli.utils import err, green, log, red, warn, yellow
-from sw_lib.config import Config, ConfigError, ConfigLoadError, ConfigValidationError
+from sw_lib.config import ConfigError, ConfigLoadError, ConfigValidationError, get_config
 
 
 def handle_error(ctx, message, exception):
@@ -27,7 +27,7 @@ def queue_cmd():
 def add_cmd(ctx, paths, shuffle):
     """Add wallpapers to the queue."""
     try:
-        config = Config()
+        config = get_config()
         qm = QueueManager(config.queue_file)
 
         new_entries = list(paths)
@@ -53,7 +53,7 @@ def add_cmd(ctx, paths, shuffle):
 def rm_cmd(ctx, paths):
     """Remove wallpapers from the queue."""
     try:
-        config = Config()
+        config = get_config()
         qm = QueueManager(config.queue_file)
 
         before = qm.get()
@@ -81,14 +81,14 @@ def list_cmd(ctx):
     List all wallpapers currently in the queue.
     """
     try:
-        config = Config()
+        config = get_config()
         qm = QueueManager(config.queue_file)
 
         entries = qm.get()
 
         if entries:
-            for i, path in enumerate(entries, start=1):
-                log(f"{yellow(i)}: {green(path)}", ctx)
+            lines = [f"{yellow(i)}: {green(path)}" for i, path in enumerate(entries, start=1)]
+            log("\n".join(lines), ctx)
         else:
             warn("No wallpapers in the queue.", ctx)
     except (ConfigLoadError, ConfigValidationError, ConfigError) as e:
@@ -107,7 +107,7 @@ def list_cmd(ctx):
 def empty_cmd(ctx):
     """Clear all wallpapers from the queue."""
     try:
-        config = Config()
+        config = get_config()
         qm = QueueManager(config.queue_file)
 
         qm.clear()
@@ -128,7 +128,7 @@ def empty_cmd(ctx):
 def shuffle_cmd(ctx):
     """Randomly shuffle the queue order."""
     try:
-        config = Config()
+        config = get_config()
         qm = QueueManager(config.queue_file)
         entries = qm.get()
 
@@ -8,7 +8,7 @@ from sw_cli.ipc import SWDaemonError
 from sw_cli.queue import QueueManager
 from sw_cli.utils import err, green, log, resolve_indexed_path
 from sw_cli.wallpaper import WallpaperApplier, WallpaperApplyError, WallpaperNotFoundError, WallpaperSelector
-from sw_lib.config import Config, ConfigError, ConfigLoadError, ConfigValidationError
+from sw_lib.config import ConfigError, ConfigLoadError, ConfigValidationError, get_config
 from sw_lib.history import HistoryEntryError, HistoryManager
 
 
@@ -30,7 +30,7 @@ def set_cmd(ctx, favorite, use_dir, path):
     - Or nothing, to pick randomly
     """
     try:
-        config = Config()
+        config = get_config()
         qm = QueueManager(config.queue_file)
         hm = HistoryManager(
             config.history_file,
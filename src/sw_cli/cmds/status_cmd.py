@@ -12,7 +12,7 @@ from sw_cli.systemd import (
     SystemdTimerStatusError,
 )
 from sw_cli.utils import err, format_boolean, green, log, prettify_path, prettify_time, yellow
-from sw_lib.config import Config, ConfigError, ConfigLoadError, ConfigValidationError
+from sw_lib.config import ConfigError, ConfigLoadError, ConfigValidationError, get_config
 from sw_lib.history import HistoryEntryNotFoundError, HistoryManager
 
 
@@ -32,9 +32,7 @@ def format_fields(wallpaper_info, timer, options):
         fields.append(("Directory", green(str(Path(wallpaper_info.path).parent))))
 
     if timer and not options.get("hide_timer"):
-        is_active = timer.is_active()
-        is_enabled = timer.is_enabled()
-        next_elapse = timer.next_elapse_mono() if is_active else None
+        is_active, is_enabled, next_elapse = timer.status()
 
         next_elapse_str = prettify_time(next_elapse) if next_elapse else yellow("N/A")
 
@@ -55,7 +53,7 @@ def format_fields(wallpaper_info, timer, options):
 def status_cmd(ctx, name, directory, hide_path, hide_timer):
     """Show the current wallpaper status."""
     try:
-        config = Config()
+        config = get_config()
         wallpaper_info = get_wallpaper_info(config)
 
         timer = SystemdTimer() if not hide_timer else None
@@ -121,14 +121,8 @@ def timer_status_cmd(ctx):
     try:
         tm = SystemdTimer()
 
-        is_active = tm.is_active()
-        is_enabled = tm.is_enabled()
-        next_elapse = None
-
-        if is_active:
-            next_elapse = prettify_time(tm.next_elapse_mono())
-        else:
-            next_elapse = "N/A"
+        is_active, is_enabled, next_elapse = tm.status()
+        next_elapse = prettify_time(next_elapse) if is_active else "N/A"
 
         result_msgs = [
             f"Active:      {format_boolean(is_active)}",
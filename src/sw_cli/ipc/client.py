@@ -2,7 +2,7 @@
 
 import socket
 
-from sw_lib.config import Config, ConfigError
+from sw_lib.config import ConfigError, get_config
 
 
 class SWDaemonError(Exception):
@@ -24,7 +24,7 @@ class SWDaemonProtocolError(SWDaemonError):
 class SWDaemonClient:
     def __init__(self, timeout=5):
         try:
-            self.socket_path = str(Config().socket_path)
+            self.socket_path = str(get_config().socket_path)
         except ConfigError as e:
             raise RuntimeError("Failed to load socket path from config") from e
 
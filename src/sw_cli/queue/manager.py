@@ -1,14 +1,17 @@
 #!/usr/bin/env python
 
+import os
 import random
 from pathlib import Path
 
 from sw_cli.queue.errors import QueueError, QueueNotFoundError, QueueReadError, QueueWriteError
+from sw_lib.utils import atomic_open
 
 
 class QueueManager:
     def __init__(self, queue_file: Path):
         self.queue_file = queue_file
+        self._cache = None
         self._ensure_file()
 
     def _ensure_file(self):
@@ -19,10 +22,17 @@ class QueueManager:
         except Exception as e:
             raise QueueWriteError(f"Failed to create queue file: {e}") from e
 
+    def _stat_key(self) -> tuple[int, int]:
+        st = self.queue_file.stat()
+        return st.st_mtime_ns, st.st_size
+
     def get(self) -> list[str]:
         try:
-            with open(self.queue_file, "r", encoding="utf-8") as f:
-                return [line.strip() for line in f if line.strip()]
+            key = self._stat_key()
+            if self._cache is None or self._cache[0] != key:
+                with open(self.queue_file, "r", encoding="utf-8") as f:
+                    self._cache = (key, [line.strip() for line in f if line.strip()])
+            return list(self._cache[1])
         except FileNotFoundError as e:
             raise QueueNotFoundError(f"Queue file not found: {self.queue_file}") from e
         except Exception as e:
@@ -30,9 +40,14 @@ class QueueManager:
 
     def add(self, paths: list[str]) -> None:
         try:
-            current_queue = self.get()
-            new_queue = current_queue + [path for path in paths if path not in current_queue]
-            self._write(new_queue)
+            seen = set(self.get())
+            new_paths = []
+            for path in paths:
+                if path not in seen:
+                    seen.add(path)
+                    new_paths.append(path)
+            if new_paths:
+                self._append(new_paths)
         except (QueueReadError, QueueWriteError) as e:
             raise e
         except Exception as e:
@@ -40,14 +55,26 @@ class QueueManager:
 
     def remove(self, paths: list[str]) -> None:
         try:
-            current_queue = self.get()
-            new_queue = [item for item in current_queue if item not in paths]
+            to_remove = frozenset(paths)
+            new_queue = [item for item in self.get() if item not in to_remove]
             self._write(new_queue)
         except (QueueReadError, QueueWriteError) as e:
             raise e
         except Exception as e:
             raise QueueError(f"An unexpected error occurred while removing items: {e}") from e
 
+    def pop_front(self) -> str | None:
+        try:
+            current_queue = self.get()
+            if not current_queue:
+                return None
+            self._write(current_queue[1:])
+            return current_queue[0]
+        except (QueueReadError, QueueWriteError) as e:
+            raise e
+        except Exception as e:
+            raise QueueError(f"An unexpected error occurred while popping from the queue: {e}") from e
+
     def clear(self) -> None:
         try:
             self._write([])
@@ -66,10 +93,24 @@ class QueueManager:
         except Exception as e:
             raise QueueError(f"An unexpected error occurred while shuffling the queue: {e}") from e
 
+    def _append(self, paths: list[str]) -> None:
+        try:
+            data = "".join(f"{path}\n" for path in paths).encode("utf-8")
+            with open(self.queue_file, "a+b") as f:
+                if f.tell():
+                    f.seek(-1, os.SEEK_END)
+                    if f.read(1) != b"\n":
+                        data = b"\n" + data
+                f.write(data)
+            self._cache = None
+        except Exception as e:
+            raise QueueWriteError(f"Failed to append to queue file: {e}") from e
+
     def _write(self, queue: list[str]) -> None:
         try:
-            with open(self.queue_file, "w", encoding="utf-8") as f:
-                for item in queue:
-                    f.write(f"{item}\n")
+            data = "".join(f"{item}\n" for item in queue).encode("utf-8")
+            with atomic_open(self.queue_file) as f:
+                f.write(data)
+            self._cache = (self._stat_key(), list(queue))
         except Exception as e:
             raise QueueWriteError(f"Failed to write queue file: {e}") from e
@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 import time
+from functools import cached_property
 
 import dbus
 
@@ -49,6 +50,12 @@ class SystemdTimer:
         except dbus.DBusException as e:
             raise SystemdTimerStatusError(f"Could not retrieve status for '{self.unit_name}'.") from e
 
+    @cached_property
+    def _timer_props(self) -> dbus.Interface:
+        # Object paths are stable for the lifetime of the unit, so the timer
+        # only needs to be looked up once per instance.
+        return self._get_unit_properties(self.systemd.LoadUnit(self.timer_unit))
+
     def _get_unit_file_state(self) -> str:
         try:
             return self.systemd.GetUnitFileState(self.timer_unit)
@@ -93,28 +100,48 @@ class SystemdTimer:
         except dbus.DBusException as e:
             raise SystemdTimerActionError(f"Failed to stop '{self.unit_name}'.") from e
 
-    def next_elapse_mono(self) -> float:
-        try:
-            timer_path = self.systemd.LoadUnit(self.timer_unit)
-            timer_proxy = self.bus.get_object("org.freedesktop.systemd1", timer_path)
-            timer_props = dbus.Interface(timer_proxy, dbus.PROPERTIES_IFACE)
-
-            next_elapse_mono = timer_props.Get("org.freedesktop.systemd1.Timer", "NextElapseUSecMonotonic")
+    def status(self) -> tuple[bool, bool, float | str | None]:
+        """
+        Return whether the timer is active and enabled, and its next elapse.
 
-            if int(next_elapse_mono) == 0:
-                return "Timer is not active"
+        All values are read from a single unit object, so this costs one
+        LoadUnit and one GetAll call (plus one Get when the timer is active)
+        instead of the separate is_active/is_enabled/next_elapse_mono calls.
+        """
+        try:
+            timer_props = self._timer_props
+            unit = timer_props.GetAll("org.freedesktop.systemd1.Unit")
+            if unit.get("LoadState") == "not-found":
+                raise SystemdTimerNotFoundError(f"Systemd unit '{self.unit_name}' not found.")
 
-            uptime_seconds = self._get_system_uptime()
-            now_usec = int(uptime_seconds * 1_000_000)
-            remaining_usec = int(next_elapse_mono) - now_usec
+            is_active = unit.get("ActiveState") == "active"
+            is_enabled = unit.get("UnitFileState") == "enabled"
+            next_elapse = None
+            if is_active:
+                next_elapse = self._remaining_seconds(
+                    timer_props.Get("org.freedesktop.systemd1.Timer", "NextElapseUSecMonotonic")
+                )
 
-            if remaining_usec < 0:
-                return "Timer expired recently"
+            return is_active, is_enabled, next_elapse
+        except dbus.DBusException as e:
+            raise SystemdTimerStatusError(f"Could not retrieve status for '{self.unit_name}'.") from e
 
-            return remaining_usec / 1_000_000
+    def next_elapse_mono(self) -> float:
+        try:
+            next_elapse_mono = self._timer_props.Get("org.freedesktop.systemd1.Timer", "NextElapseUSecMonotonic")
+            return self._remaining_seconds(next_elapse_mono)
 
         except dbus.DBusException as e:
             raise SystemdTimerStatusError("Unable to retrieve next elapse time.") from e
 
-    def _get_system_uptime(self) -> float:
-        return time.monotonic()
+    def _remaining_seconds(self, next_elapse_mono) -> float | str:
+        if int(next_elapse_mono) == 0:
+            return "Timer is not active"
+
+        now_usec = time.monotonic_ns() // 1000
+        remaining_usec = int(next_elapse_mono) - now_usec
+
+        if remaining_usec < 0:
+            return "Timer expired recently"
+
+        return remaining_usec / 1_000_000
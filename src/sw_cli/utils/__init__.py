@@ -1,6 +1,7 @@
 #!/usr/bin/env python
 
 from .common import (
+    cli_errors,
     err,
     is_valid_image,
     log,
@@ -27,6 +28,7 @@ from .style import (
 
 __all__ = [
     "bold",
+    "cli_errors",
     "cyan",
     "err",
     "format_boolean",
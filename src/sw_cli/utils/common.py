@@ -1,24 +1,41 @@
 #!/usr/bin/env python
 
+import functools
+import os
 import re
 import sys
 
-import notify2
-from PIL import Image
+import click
 
 from sw_cli.utils.style import bold, red, yellow
+from sw_lib.utils import atomic_open
 
-Image.MAX_IMAGE_PIXELS = None
+DEFAULT_FLAGS = (False, True)  # (silent, notify) when the group did not set them
 ANSI_ESCAPE = re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]")
+INDEX_PATTERN = re.compile(r"@(-?\d+)\Z")
+PATH_NUMBER = re.compile(r"\b0*(\d+)\b")
+PATH_SEPARATORS = str.maketrans("-_", "  ")
+IMAGE_SIGNATURES = (b"\x89PNG\r\n\x1a\n", b"\xff\xd8\xff", b"GIF87a", b"GIF89a", b"II*\x00", b"MM\x00*")
 
 
 def strip_ansi(text: str) -> str:
+    if "\x1b" not in text:
+        return text
     return ANSI_ESCAPE.sub("", text)
 
 
+@functools.cache
+def init_notify():
+    # notify2 pulls in dbus; only import it when a notification is sent.
+    import notify2  # pylint: disable=import-outside-toplevel
+
+    notify2.init("Switch Wallpaper")
+    return notify2
+
+
 def notify(title: str, message: str):
     try:
-        notify2.init("Switch Wallpaper")
+        notify2 = init_notify()
         n = notify2.Notification(title, message)
         n.set_timeout(3000)
         n.show()
@@ -28,8 +45,7 @@ def notify(title: str, message: str):
 
 def log(message: str, ctx: dict = None):
     ctx = ctx or {}
-    silent = ctx.obj.get("silent", False)
-    notify_enabled = ctx.obj.get("notify", True)
+    silent, notify_enabled = ctx.obj.get("flags", DEFAULT_FLAGS)
 
     if silent:
         return
@@ -43,8 +59,7 @@ def log(message: str, ctx: dict = None):
 
 def warn(message: str, ctx: dict = None):
     ctx = ctx or {}
-    silent = ctx.obj.get("silent", False)
-    notify_enabled = ctx.obj.get("notify", True)
+    silent, notify_enabled = ctx.obj.get("flags", DEFAULT_FLAGS)
 
     if silent:
         return
@@ -59,8 +74,7 @@ def warn(message: str, ctx: dict = None):
 
 def err(message: str, exc: Exception, ctx: dict = None):
     ctx = ctx or {}
-    silent = ctx.obj.get("silent", False)
-    notify_enabled = ctx.obj.get("notify", True)
+    silent, notify_enabled = ctx.obj.get("flags", DEFAULT_FLAGS)
 
     if silent:
         ctx.exit(1)
@@ -76,18 +90,44 @@ def err(message: str, exc: Exception, ctx: dict = None):
     ctx.exit(1)
 
 
-def replace_lines_in_file(filepath: str, patterns: dict[str, str]):
-    with open(filepath, "r", encoding="utf-8") as file:
-        lines = file.readlines()
+def cli_errors(*handlers, message: str = "Unexpected error"):
+    """
+    Report exceptions escaping a command through err().
+
+    Each handler is an (exception types, message) pair; the first pair
+    matching the exception provides the message, anything else is reported
+    with the generic message. Messages are formatted with the command's
+    keyword arguments, e.g. "Error getting key '{key}'".
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except click.exceptions.Exit:
+                raise
+            except Exception as e:
+                ctx = click.get_current_context()
+                for exc_types, handler_message in handlers:
+                    if isinstance(e, exc_types):
+                        err(handler_message.format(**kwargs), e, ctx)
+                err(message.format(**kwargs), e, ctx)
+                raise
+
+        return wrapper
 
-    new_lines = []
-    for line in lines:
-        for pattern, replacement in patterns.items():
-            line = re.sub(pattern, replacement, line)
-        new_lines.append(line)
+    return decorator
+
+
+def replace_lines_in_file(filepath: str, patterns: dict[str, str]):
+    compiled = [(re.compile(pattern), replacement) for pattern, replacement in patterns.items()]
 
-    with open(filepath, "w", encoding="utf-8") as file:
-        file.writelines(new_lines)
+    with open(filepath, "r", encoding="utf-8") as src, atomic_open(filepath, "w", encoding="utf-8") as dst:
+        for line in src:
+            for pattern, replacement in compiled:
+                line = pattern.sub(replacement, line)
+            dst.write(line)
 
 
 def resolve_indexed_path(index, entries):
@@ -96,19 +136,46 @@ def resolve_indexed_path(index, entries):
     Index is 1-based, e.g. @1 means entries[0].
     Can be negative for reverse indexing (e.g. @-1 is entries[-1]).
     """
+    match = INDEX_PATTERN.match(index)
+    idx = int(match.group(1)) if match else 0
+    if idx == 0:
+        raise ValueError(f"Invalid index '{index}' for entries: {entries}")
+
     try:
-        idx = int(index[1:])
-        if idx == 0:
-            raise ValueError("Index must not be 0 (1-based indexing)")
-        if idx > 0:
-            return entries[idx - 1]
-
-        return entries[idx]
-    except (ValueError, IndexError) as e:
+        return entries[idx - 1] if idx > 0 else entries[idx]
+    except IndexError as e:
         raise ValueError(f"Invalid index '{index}' for entries: {entries}") from e
 
 
-def is_valid_image(path: str) -> bool:
+def has_image_signature(path: str) -> bool:
+    """Check the first bytes of a file against well-known image signatures."""
+    try:
+        with open(path, "rb") as f:
+            head = f.read(12)
+    except OSError:
+        return False
+    return (
+        head.startswith(IMAGE_SIGNATURES)
+        or (head[:4] == b"RIFF" and head[8:12] == b"WEBP")
+        # BMP only has a two byte magic, so also require the reserved fields to be zero.
+        or (head[:2] == b"BM" and head[6:10] == b"\0\0\0\0")
+    )
+
+
+def is_valid_image(path: str, verify: bool = False) -> bool:
+    """
+    Check whether a file is an image.
+
+    A known signature is enough for cheap filtering; with verify=True, or
+    when no signature matches, the file is fully verified through PIL.
+    """
+    if not verify and has_image_signature(path):
+        return True
+
+    # PIL is slow to import and verifies the whole file.
+    from PIL import Image  # pylint: disable=import-outside-toplevel
+
+    Image.MAX_IMAGE_PIXELS = None
     try:
         with Image.open(path) as img:
             img.verify()
@@ -138,8 +205,8 @@ def prettify_time(seconds: float) -> str:
 
 def prettify_path(path: str) -> str:
     """Convert a file path to a more readable format."""
-    name = re.sub(r"^.*[\\/]", "", path)
-    name = re.sub(r"[-_]", " ", name)
-    name = re.sub(r"\.[^.]+$", "", name)
-    name = re.sub(r"\b0*(\d+)\b", r"(\1)", name)
+    name = path.rsplit("/", 1)[-1].rsplit("\\", 1)[-1]
+    name = os.path.splitext(name)[0]
+    name = name.translate(PATH_SEPARATORS)
+    name = PATH_NUMBER.sub(r"(\1)", name)
     return name.strip()
@@ -5,20 +5,27 @@ import sys
 import click
 
 COLOR_MODE = "auto"
+COLOR_ENABLED = None
 
 
 def set_color_mode(mode: str):
     # pylint: disable=global-statement
-    global COLOR_MODE
+    global COLOR_MODE, COLOR_ENABLED
     COLOR_MODE = mode.lower()
+    COLOR_ENABLED = None
 
 
 def should_color():
-    if COLOR_MODE == "always":
-        return True
-    if COLOR_MODE == "never":
-        return False
-    return sys.stdout.isatty()
+    # pylint: disable=global-statement
+    global COLOR_ENABLED
+    if COLOR_ENABLED is None:
+        if COLOR_MODE == "always":
+            COLOR_ENABLED = True
+        elif COLOR_MODE == "never":
+            COLOR_ENABLED = False
+        else:
+            COLOR_ENABLED = sys.stdout.isatty()
+    return COLOR_ENABLED
 
 
 def style(text, **kwargs):
@@ -96,20 +103,14 @@ def format_json(obj, indent=0):
 
     if isinstance(obj, dict):
         lines = []
-        for i, (k, v) in enumerate(obj.items()):
+        for k, v in obj.items():
             colored_key = cyan(f'"{k}"')
-            colored_val = format_json(v, indent + 2)
-            comma = "," if i < len(obj) - 1 else ""
-            lines.append(f"{spaces}  {colored_key}: {colored_val}{comma}")
-        result = "{\n" + "\n".join(lines) + f"\n{spaces}}}"
+            lines.append(f"{spaces}  {colored_key}: {format_json(v, indent + 2)}")
+        result = "{\n" + ",\n".join(lines) + f"\n{spaces}}}"
 
     elif isinstance(obj, list):
-        lines = []
-        for i, item in enumerate(obj):
-            colored_item = format_json(item, indent + 2)
-            comma = "," if i < len(obj) - 1 else ""
-            lines.append(f"{spaces}  {colored_item}{comma}")
-        result = "[\n" + "\n".join(lines) + f"\n{spaces}]"
+        lines = [f"{spaces}  {format_json(item, indent + 2)}" for item in obj]
+        result = "[\n" + ",\n".join(lines) + f"\n{spaces}]"
 
     else:
         if isinstance(obj, str):
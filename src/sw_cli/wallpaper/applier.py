@@ -5,13 +5,13 @@ from pathlib import Path
 from sw_cli.ipc import SWDaemonClient, SWDaemonConnectionError, SWDaemonError, SWDaemonProtocolError
 from sw_cli.utils import replace_lines_in_file
 from sw_cli.wallpaper.errors import WallpaperApplyError
-from sw_lib.config import Config, ConfigError, ConfigLoadError, ConfigValidationError
+from sw_lib.config import ConfigError, ConfigLoadError, ConfigValidationError, get_config
 
 
 class WallpaperApplier:
     def __init__(self, history_manager, daemon_client=None):
         try:
-            self.config = Config()
+            self.config = get_config()
 
             self.hyprlock_enabled = self.config.hyprlock_enabled
             if self.hyprlock_enabled:
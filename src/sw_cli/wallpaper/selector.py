@@ -1,12 +1,15 @@
 #!/usr/bin/env python
 
+import os
 import random
-import time
+from functools import cached_property
 from pathlib import Path
 
 from sw_cli.utils.common import is_valid_image
 from sw_cli.wallpaper.errors import WallpaperError, WallpaperNotFoundError
 
+IMAGE_EXTENSIONS = frozenset({".bmp", ".gif", ".jpeg", ".jpg", ".png", ".tif", ".tiff", ".webp"})
+
 
 class WallpaperDirectoryError(WallpaperError):
     """Raised when there is an issue accessing a wallpaper directory."""
@@ -18,6 +21,10 @@ class WallpaperSelector:
         self.queue = queue_manager
         self.history = history_manager
 
+    @cached_property
+    def _exclude_dirs(self) -> tuple[str, ...]:
+        return tuple(os.path.realpath(path) for path in self.config.recency_exclude)
+
     def select_wallpaper(self, path: str | Path = None, use_dir: bool = False) -> Path:
         """
         Figure out what wallpaper path to set.
@@ -35,17 +42,16 @@ class WallpaperSelector:
                     raise WallpaperNotFoundError(f"Specified path does not exist: {target}")
                 if target.is_dir():
                     return self._pick_from_directory(target)
-                if not is_valid_image(str(target)):
+                if not is_valid_image(str(target), verify=True):
                     raise WallpaperError(f"Specified file is not a valid image: {target}")
                 return target
 
-            queued = self.queue.get()
+            queued = self.queue.pop_front()
             if queued:
-                next_item = Path(queued.pop(0))
-                self.queue.remove([str(next_item)])
+                next_item = Path(queued)
                 if not next_item.exists():
                     raise WallpaperNotFoundError(f"Queued wallpaper does not exist: {next_item}")
-                if not is_valid_image(str(next_item)):
+                if not is_valid_image(str(next_item), verify=True):
                     raise WallpaperError(f"Queued wallpaper is not a valid image: {next_item}")
                 return next_item
 
@@ -73,28 +79,34 @@ class WallpaperSelector:
             if not directory.exists() or not directory.is_dir():
                 raise WallpaperDirectoryError(f"Invalid wallpaper directory: {directory}")
 
-            now = time.time()
-            exclude_dirs = {Path(p).expanduser().resolve() for p in self.config.recency_exclude}
+            exclude_dirs = self._exclude_dirs
 
-            recent_entries = self.history.get_recent_entries()
+            # History already stores resolved paths, so they are compared as is.
             recent_paths = set()
-
-            for entry in recent_entries:
-                entry_path = Path(entry.path).expanduser().resolve()
-                entry_dir = entry_path.parent
-
-                if self.config.recency_timeout and (now - entry.time) < self.config.recency_timeout:
-                    if not any(entry_dir == ex or entry_dir.is_relative_to(ex) for ex in exclude_dirs):
-                        recent_paths.add(str(entry_path))
-
-            candidates = [
-                f for f in directory.iterdir() if f.is_file() and is_valid_image(str(f)) and str(f) not in recent_paths
-            ]
-
-            if not candidates:
-                raise WallpaperNotFoundError(f"No suitable wallpapers found in {directory}")
-
-            return random.choice(candidates)
+            for path in self.history.get_recent_paths():
+                parent = os.path.dirname(path)
+
+                if not any(parent == ex or parent.startswith(ex + os.sep) for ex in exclude_dirs):
+                    recent_paths.add(path)
+
+            # Symlinked candidates are compared by their target.
+            with os.scandir(directory) as it:
+                candidates = [
+                    entry.path
+                    for entry in it
+                    if os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS
+                    and (os.path.realpath(entry.path) if entry.is_symlink() else entry.path) not in recent_paths
+                    and entry.is_file()
+                ]
+
+            # Only the picked file is opened and verified; broken images are
+            # dropped and another candidate is tried.
+            while candidates:
+                candidate = candidates.pop(random.randrange(len(candidates)))
+                if is_valid_image(candidate, verify=True):
+                    return Path(candidate)
+
+            raise WallpaperNotFoundError(f"No suitable wallpapers found in {directory}")
 
         except WallpaperError:
             raise
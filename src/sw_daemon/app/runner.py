@@ -4,7 +4,7 @@ import logging
 import threading
 
 from sw_daemon.ipc.socket import SocketServer
-from sw_lib.config import Config, ConfigError, ConfigLoadError, ConfigValidationError
+from sw_lib.config import ConfigError, ConfigLoadError, ConfigValidationError, get_config
 from sw_lib.history import HistoryEntryNotFoundError, HistoryManager
 
 from .core import SWDaemon
@@ -14,7 +14,7 @@ logger = logging.getLogger("sw-daemon.runner")
 
 def start(image_path=None):
     try:
-        config = Config()
+        config = get_config()
         hm = HistoryManager(
             config.history_file,
             config.history_limit,
@@ -4,13 +4,13 @@ import logging
 import os
 import socket
 
-from sw_lib.config import Config, ConfigError, ConfigLoadError, ConfigValidationError
+from sw_lib.config import ConfigError, ConfigLoadError, ConfigValidationError, get_config
 
 
 class SocketServer:
     def __init__(self, wallpaper_setter):
         try:
-            self.config = Config()
+            self.config = get_config()
             self.socket_path = str(self.config.socket_path)
         except ConfigLoadError as e:
             raise RuntimeError("Failed to load configuration") from e
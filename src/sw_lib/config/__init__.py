@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 
-from .config import Config
+from .config import Config, get_config
 from .errors import ConfigError, ConfigKeyError, ConfigLoadError, ConfigValidationError, ConfigWriteError
 
 __all__ = [
@@ -10,4 +10,5 @@ __all__ = [
     "ConfigLoadError",
     "ConfigValidationError",
     "ConfigWriteError",
+    "get_config",
 ]
@@ -1,11 +1,17 @@
 #!/usr/bin/env python
 
 import json
-from functools import cached_property
+from functools import cache, cached_property
 from pathlib import Path
+from typing import Set
+
+from sw_lib.utils import atomic_open
 
 from .errors import ConfigError, ConfigKeyError, ConfigLoadError, ConfigValidationError, ConfigWriteError
 
+CONFIG_FILE = Path.home() / ".config" / "sw" / "config.json"
+MISSING = object()
+
 
 class Config:
     DEFAULT_CONFIG = {
@@ -34,9 +40,10 @@ class Config:
     }
 
     def __init__(self, *, config_file=None, indent_json=True):
-        self._config_file = Path(config_file) if config_file else Path.home() / ".config" / "sw" / "config.json"
+        self._config_file = Path(config_file) if config_file else CONFIG_FILE
         self._indent_json = indent_json
         self._data = self._load_merged_config()
+        self._dirty = False
 
     def _is_valid_key(self, dotted_key):
         keys = dotted_key.split(".")
@@ -80,11 +87,11 @@ class Config:
         keys = dotted_key.split(".")
         data = self._data
         for key in keys:
-            if not isinstance(data, dict) or key not in data:
+            data = data.get(key, MISSING) if isinstance(data, dict) else MISSING
+            if data is MISSING:
                 if default is not None:
                     return default
                 raise ConfigError(f"Invalid config key: '{dotted_key}'")
-            data = data[key]
         return data
 
     def _set_nested(self, dotted_key, value):
@@ -106,37 +113,48 @@ class Config:
         data.pop(keys[-1], None)
 
     def _clear_cache(self):
-        self.__dict__.pop("_socket_path", None)
-        self.__dict__.pop("_hyprlock_config", None)
-        self.__dict__.pop("_favorites", None)
-        self.__dict__.pop("_history_file", None)
-        self.__dict__.pop("_history_limit", None)
-        self.__dict__.pop("_queue_file", None)
-        self.__dict__.pop("_recency_timeout", None)
-        self.__dict__.pop("_recency_exclude", None)
-        self.__dict__.pop("_wallpaper_dir", None)
+        for name in (
+            "socket_path",
+            "hyprlock_enabled",
+            "hyprlock_config",
+            "favorites",
+            "_favorite_set",
+            "history_file",
+            "history_limit",
+            "queue_file",
+            "recency_timeout",
+            "recency_exclude",
+            "wallpaper_dir",
+        ):
+            self.__dict__.pop(name, None)
 
     def get(self, key, default=None):
         return self._get_nested(key, default)
 
     def set(self, key, value):
+        if not self._is_valid_key(key):
+            raise ConfigError(f"Invalid config key: '{key}'")
         self._set_nested(key, value)
         self._clear_cache()
-        self.save()
+        self._dirty = True
 
     def unset(self, key):
         self._unset_nested(key)
         self._clear_cache()
-        self.save()
+        self._dirty = True
+
+    def flush(self):
+        """Write pending changes made through set() and unset() to disk."""
+        if self._dirty:
+            self.save()
+            self._dirty = False
 
     def save(self):
         try:
+            data = json.dumps(self._data, indent=2 if self._indent_json else None).encode("utf-8")
             self._config_file.parent.mkdir(parents=True, exist_ok=True)
-            with self._config_file.open("w", encoding="utf-8") as f:
-                if self._indent_json:
-                    json.dump(self._data, f, indent=2)
-                else:
-                    json.dump(self._data, f)
+            with atomic_open(self._config_file) as f:
+                f.write(data)
         except Exception as e:
             raise ConfigWriteError(f"Failed to write config: {e}") from e
 
@@ -172,6 +190,33 @@ class Config:
             raise ConfigError("'wallpaper.favorites' must be a list")
         return [Path(f).expanduser().absolute() for f in favs]
 
+    @cached_property
+    def _favorite_set(self) -> Set[str]:
+        return {str(f) for f in self.favorites}
+
+    def _store_favorites(self):
+        self._set_nested("wallpaper.favorites", [str(f) for f in self.favorites])
+        self._dirty = True
+
+    def is_favorite(self, path: str) -> bool:
+        return path in self._favorite_set
+
+    def add_favorite(self, path: str) -> bool:
+        if self.is_favorite(path):
+            return False
+        self.favorites.append(Path(path))
+        self._favorite_set.add(path)
+        self._store_favorites()
+        return True
+
+    def remove_favorite(self, path: str) -> bool:
+        if not self.is_favorite(path):
+            return False
+        self.favorites.remove(Path(path))
+        self._favorite_set.discard(path)
+        self._store_favorites()
+        return True
+
     @cached_property
     def history_file(self) -> Path:
         return Path(self.get("history.file")).expanduser().absolute()
@@ -201,3 +246,9 @@ class Config:
         if not path:
             raise ConfigError("Missing required config key: 'wallpaper.directory'")
         return Path(path).expanduser().absolute()
+
+
+@cache
+def get_config() -> Config:
+    """Return the configuration instance shared by the whole process."""
+    return Config()
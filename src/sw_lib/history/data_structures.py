@@ -4,6 +4,8 @@
 class HistoryEntry:
     """Represents a single entry in the wallpaper history."""
 
+    __slots__ = ("path", "time")
+
     def __init__(self, path: str, timestamp: int):
         """Initialize a history entry with a path and timestamp."""
         self.path = path
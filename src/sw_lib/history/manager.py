@@ -5,6 +5,8 @@ import time
 from pathlib import Path
 from typing import Set
 
+from sw_lib.utils import atomic_open
+
 from .data_structures import HistoryEntry
 from .errors import (
     HistoryEntryNotFoundError,
@@ -33,8 +35,7 @@ class HistoryManager:
 
     def _load_history(self) -> list:
         try:
-            with open(self.history_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return json.loads(self.history_file.read_bytes())
         except FileNotFoundError as e:
             raise HistoryNotFoundError(f"History file not found: {self.history_file}") from e
         except json.JSONDecodeError as e:
@@ -44,8 +45,9 @@ class HistoryManager:
 
     def _write(self, entries: list) -> None:
         try:
-            with open(self.history_file, "w", encoding="utf-8") as f:
-                json.dump(entries, f, indent=4)
+            data = json.dumps(entries, separators=(",", ":")).encode("utf-8")
+            with atomic_open(self.history_file) as f:
+                f.write(data)
         except Exception as e:
             raise HistoryWriteError(f"Failed to write history to file: {e}") from e
 
@@ -65,19 +67,15 @@ class HistoryManager:
         try:
             entry = {"path": path, "time": int(time.time())}
             self.history.append(entry)
-            self.history = self.history[-self.history_limit :]
+            if len(self.history) > self.history_limit:
+                del self.history[: -self.history_limit]
             self._write(self.history)
         except HistoryWriteError as e:
             raise HistoryWriteError(f"Failed to add entry to history: {e}") from e
 
-    def get_recent_entries(self) -> Set[HistoryEntry]:
-        now = int(time.time())
-        recent_entries = set()
-        for entry in self.history:
-            entry_time = entry["time"]
-            if now - entry_time < self.recency_timeout:
-                recent_entries.add(HistoryEntry.from_dict(entry))
-        return recent_entries
+    def get_recent_paths(self) -> Set[str]:
+        cutoff = int(time.time()) - self.recency_timeout
+        return {entry["path"] for entry in self.history if entry["time"] > cutoff}
 
     def is_empty(self) -> bool:
         return len(self.history) == 0
@@ -89,6 +87,13 @@ class HistoryManager:
         except HistoryWriteError as e:
             raise HistoryWriteError(f"Failed to clear history: {e}") from e
 
+    def replace(self, entries: list[HistoryEntry]) -> None:
+        try:
+            self.history = [entry.to_dict() for entry in entries]
+            self._write(self.history)
+        except HistoryWriteError as e:
+            raise HistoryWriteError(f"Failed to replace history: {e}") from e
+
     def remove_by_index(self, index: int) -> None:
         try:
             del self.history[index]
@@ -0,0 +1,7 @@
+#!/usr/bin/env python
+
+from .files import atomic_open
+
+__all__ = [
+    "atomic_open",
+]
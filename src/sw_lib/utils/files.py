@@ -0,0 +1,41 @@
+#!/usr/bin/env python
+
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager, suppress
+
+
+def _apply_mode(target: str, tmp_file: str) -> None:
+    if os.path.exists(target):
+        shutil.copymode(target, tmp_file)
+        return
+
+    # mkstemp creates files as 0600; give new files the usual umask-based mode.
+    umask = os.umask(0)
+    os.umask(umask)
+    os.chmod(tmp_file, 0o666 & ~umask)
+
+
+@contextmanager
+def atomic_open(path, mode: str = "wb", **kwargs):
+    """
+    Open a temporary sibling of path for writing and move it into place on success.
+
+    Symlinks are resolved first so the link itself is kept. Every writer gets
+    its own temporary file, which is synced to disk before it replaces the
+    target, takes over the original file mode, and is removed if writing fails.
+    """
+    target = os.path.realpath(path)
+    fd, tmp_file = tempfile.mkstemp(dir=os.path.dirname(target), prefix=f".{os.path.basename(target)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, mode, **kwargs) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        _apply_mode(target, tmp_file)
+        os.replace(tmp_file, target)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(tmp_file)
+        raise